@@ -8,7 +8,8 @@ $tentacle_description: {
     "version": "1.1.1",
     "requirements": [],
     "config_files": ["RedditForumEvaluator.json"],
-    "config_schema_files": ["RedditForumEvaluator_schema.json"]
+    "config_schema_files": ["RedditForumEvaluator_schema.json"],
+    "tests": ["test_forum_evaluator"]
 }
 """
 
@@ -52,6 +53,8 @@ class RedditForumEvaluator(ForumSocialEvaluator, DispatcherAbstractClient):
         self.symbol = ""
         self.sentiment_analyser = None
         self.is_self_refreshing = True
+        # lowered subreddits for this symbol
+        self.interesting_subreddits = set()
 
     def set_dispatcher(self, dispatcher):
         super().set_dispatcher(dispatcher)
@@ -88,11 +91,7 @@ class RedditForumEvaluator(ForumSocialEvaluator, DispatcherAbstractClient):
 
     def is_interested_by_this_notification(self, notification_description):
         # true if in this symbol's subreddits configuration
-        if self.social_config[CONFIG_REDDIT_SUBREDDITS]:
-            for subreddit in self.social_config[CONFIG_REDDIT_SUBREDDITS][self.symbol]:
-                if subreddit.lower() == notification_description:
-                    return True
-        return False
+        return notification_description in self.interesting_subreddits
 
     def _get_config_elements(self, key):
         if CONFIG_CRYPTO_CURRENCIES in self.social_config and self.social_config[CONFIG_CRYPTO_CURRENCIES]:
@@ -103,6 +102,8 @@ class RedditForumEvaluator(ForumSocialEvaluator, DispatcherAbstractClient):
     def _format_config(self):
         # remove other symbols data to avoid unnecessary entries
         self.social_config[CONFIG_REDDIT_SUBREDDITS] = self._get_config_elements(CONFIG_REDDIT_SUBREDDITS)
+        subreddits = self.social_config[CONFIG_REDDIT_SUBREDDITS].get(self.symbol, [])
+        self.interesting_subreddits = {subreddit.lower() for subreddit in subreddits}
 
     def prepare(self):
         self._format_config()
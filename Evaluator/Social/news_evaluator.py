@@ -8,7 +8,8 @@ $tentacle_description: {
     "version": "1.1.1",
     "requirements": [],
     "config_files": ["TwitterNewsEvaluator.json"],
-    "config_schema_files": ["TwitterNewsEvaluator_schema.json"]
+    "config_schema_files": ["TwitterNewsEvaluator_schema.json"],
+    "tests": ["test_news_evaluator"]
 }
 """
 
@@ -56,6 +57,9 @@ class TwitterNewsEvaluator(NewsSocialEvaluator, DispatcherAbstractClient):
         self.symbol = ""
         self.sentiment_analyser = None
         self.is_self_refreshing = True
+        # lowered accounts and hashtags for this symbol
+        self.interesting_accounts = []
+        self.interesting_hashtags = []
 
     def set_dispatcher(self, dispatcher):
         super().set_dispatcher(dispatcher)
@@ -75,8 +79,8 @@ class TwitterNewsEvaluator(NewsSocialEvaluator, DispatcherAbstractClient):
     async def receive_notification_data(self, data):
         self.count += 1
         note = self.get_tweet_sentiment(data[CONFIG_TWEET], data[CONFIG_TWEET_DESCRIPTION])
-        tweet_url = f"https://twitter.com/ProducToken/status/{data['tweet']['id']}"
         if note != START_PENDING_EVAL_NOTE:
+            tweet_url = f"https://twitter.com/ProducToken/status/{data['tweet']['id']}"
             self._print_tweet(data[CONFIG_TWEET_DESCRIPTION], tweet_url, note, str(self.count))
         await self._check_eval_note(note)
 
@@ -93,30 +97,22 @@ class TwitterNewsEvaluator(NewsSocialEvaluator, DispatcherAbstractClient):
         return TwitterNewsEvaluator._EVAL_MAX_TIME_TO_LIVE * abs(evaluation)
 
     def get_tweet_sentiment(self, tweet, tweet_text, is_a_quote=False):
-        try:
-            if is_a_quote:
+        if is_a_quote:
+            return -1 * self.sentiment_analyser.analyse(tweet_text)
+        accounts = self.social_config.get(CONFIG_TWITTERS_ACCOUNTS, {}).get(self.symbol)
+        if accounts:
+            author = tweet.get('user', {})
+            if author.get('screen_name') in accounts or author.get('name') in accounts:
                 return -1 * self.sentiment_analyser.analyse(tweet_text)
-            else:
-                stupid_useless_name = "########"
-                author_screen_name = tweet['user']['screen_name'] if "screen_name" in tweet['user'] \
-                    else stupid_useless_name
-                author_name = tweet['user']['name'] if "name" in tweet['user'] else stupid_useless_name
-                if self.social_config[CONFIG_TWITTERS_ACCOUNTS]:
-                    if author_screen_name in self.social_config[CONFIG_TWITTERS_ACCOUNTS][self.symbol] \
-                       or author_name in self.social_config[CONFIG_TWITTERS_ACCOUNTS][self.symbol]:
-                        return -1 * self.sentiment_analyser.analyse(tweet_text)
-        except KeyError:
-            pass
 
         # ignore # for the moment (too much of bullshit)
         return START_PENDING_EVAL_NOTE
 
     def is_interested_by_this_notification(self, notification_description):
         # true if in twitter accounts
-        if self.social_config[CONFIG_TWITTERS_ACCOUNTS]:
-            for account in self.social_config[CONFIG_TWITTERS_ACCOUNTS][self.symbol]:
-                if account.lower() in notification_description:
-                    return True
+        for account in self.interesting_accounts:
+            if account in notification_description:
+                return True
 
         # false if it's a RT of an unfollowed account
         if notification_description.startswith("rt"):
@@ -127,11 +123,10 @@ class TwitterNewsEvaluator(NewsSocialEvaluator, DispatcherAbstractClient):
             return True
 
         # true if in hashtags
-        if self.social_config[CONFIG_TWITTERS_HASHTAGS]:
-            for hashtags in self.social_config[CONFIG_TWITTERS_HASHTAGS][self.symbol]:
-                if hashtags.lower() in notification_description:
-                    return True
-            return False
+        for hashtags in self.interesting_hashtags:
+            if hashtags in notification_description:
+                return True
+        return False
 
     def _get_config_elements(self, key):
         if CONFIG_CRYPTO_CURRENCIES in self.social_config and self.social_config[CONFIG_CRYPTO_CURRENCIES]:
@@ -143,6 +138,10 @@ class TwitterNewsEvaluator(NewsSocialEvaluator, DispatcherAbstractClient):
         # remove other symbols data to avoid unnecessary tweets
         self.social_config[CONFIG_TWITTERS_ACCOUNTS] = self._get_config_elements(CONFIG_TWITTERS_ACCOUNTS)
         self.social_config[CONFIG_TWITTERS_HASHTAGS] = self._get_config_elements(CONFIG_TWITTERS_HASHTAGS)
+        self.interesting_accounts = [account.lower()
+                                     for account in self.social_config[CONFIG_TWITTERS_ACCOUNTS].get(self.symbol, [])]
+        self.interesting_hashtags = [hashtag.lower()
+                                     for hashtag in self.social_config[CONFIG_TWITTERS_HASHTAGS].get(self.symbol, [])]
 
     def prepare(self):
         self._format_config()
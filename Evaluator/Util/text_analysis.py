@@ -26,16 +26,16 @@ $tentacle_description: {
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from tools.decoding_encoding import DecoderEncoder
 
 from evaluator.Util.abstract_util import AbstractUtil
-from newspaper import Article
 from config import IMAGE_ENDINGS
 
 
 class TextAnalysis(AbstractUtil):
     def __init__(self):
+        # vaderSentiment and newspaper are heavy to import: only load them when text analysis is actually used
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
         self.analyzer = SentimentIntensityAnalyzer()
         # self.test()
 
@@ -47,6 +47,7 @@ class TextAnalysis(AbstractUtil):
 
     # returns the article object and the analysis result
     def analyse_web_page_article(self, url):
+        from newspaper import Article
         article = Article(url)
         article.download()
         article.parse()
@@ -0,0 +1,44 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+from config import CONFIG_CRYPTO_CURRENCIES, CONFIG_CRYPTO_CURRENCY, CONFIG_REDDIT_SUBREDDITS
+from evaluator.Social import RedditForumEvaluator
+
+
+def _get_evaluator(crypto_currencies):
+    evaluator = RedditForumEvaluator()
+    evaluator.symbol = "Bitcoin"
+    evaluator.social_config = {CONFIG_CRYPTO_CURRENCIES: crypto_currencies}
+    evaluator._format_config()
+    return evaluator
+
+
+def test_is_interested_by_this_notification_with_empty_config():
+    evaluator = _get_evaluator([])
+    assert not evaluator.is_interested_by_this_notification("bitcoin")
+
+
+def test_is_interested_by_this_notification_with_missing_symbol():
+    evaluator = _get_evaluator([{CONFIG_CRYPTO_CURRENCY: "Ethereum", CONFIG_REDDIT_SUBREDDITS: ["ethereum"]}])
+    assert not evaluator.is_interested_by_this_notification("ethereum")
+    assert not evaluator.is_interested_by_this_notification("bitcoin")
+
+
+def test_is_interested_by_this_notification_with_mixed_case_config():
+    evaluator = _get_evaluator([{CONFIG_CRYPTO_CURRENCY: "Bitcoin", CONFIG_REDDIT_SUBREDDITS: ["Bitcoin", "BTC"]}])
+    assert evaluator.is_interested_by_this_notification("bitcoin")
+    assert evaluator.is_interested_by_this_notification("btc")
+    assert not evaluator.is_interested_by_this_notification("bitcoinmarkets")
@@ -0,0 +1,83 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+from config import CONFIG_CRYPTO_CURRENCIES, CONFIG_CRYPTO_CURRENCY, CONFIG_TWITTERS_ACCOUNTS, \
+    CONFIG_TWITTERS_HASHTAGS, START_PENDING_EVAL_NOTE
+from evaluator.Social import TwitterNewsEvaluator
+
+
+class _FixedSentimentAnalyser:
+    @staticmethod
+    def analyse(_):
+        return 0.5
+
+
+def _get_evaluator(crypto_currencies):
+    evaluator = TwitterNewsEvaluator()
+    evaluator.symbol = "Bitcoin"
+    evaluator.social_config = {CONFIG_CRYPTO_CURRENCIES: crypto_currencies}
+    evaluator._format_config()
+    return evaluator
+
+
+def _get_crypto_currency(name, accounts, hashtags):
+    return {
+        CONFIG_CRYPTO_CURRENCY: name,
+        CONFIG_TWITTERS_ACCOUNTS: accounts,
+        CONFIG_TWITTERS_HASHTAGS: hashtags
+    }
+
+
+def test_is_interested_by_this_notification_with_empty_config():
+    evaluator = _get_evaluator([])
+    assert not evaluator.is_interested_by_this_notification("elonmusk: #crypto to the moon")
+    assert evaluator.is_interested_by_this_notification("bitcoin to the moon")
+
+
+def test_is_interested_by_this_notification_with_missing_symbol():
+    evaluator = _get_evaluator([_get_crypto_currency("Ethereum", ["VitalikButerin"], ["#ETH"])])
+    assert not evaluator.is_interested_by_this_notification("vitalikbuterin: #eth to the moon")
+    assert evaluator.is_interested_by_this_notification("bitcoin to the moon")
+
+
+def test_is_interested_by_this_notification_with_mixed_case_config():
+    evaluator = _get_evaluator([_get_crypto_currency("Bitcoin", ["ElonMusk"], ["#HODL"])])
+    assert evaluator.is_interested_by_this_notification("elonmusk: doge to the moon")
+    assert evaluator.is_interested_by_this_notification("#hodl doge")
+    assert evaluator.is_interested_by_this_notification("bitcoin to the moon")
+    assert not evaluator.is_interested_by_this_notification("rt @someone: #hodl doge")
+    assert not evaluator.is_interested_by_this_notification("doge to the moon")
+
+
+def test_get_tweet_sentiment():
+    evaluator = _get_evaluator([_get_crypto_currency("Bitcoin", ["ElonMusk"], [])])
+    evaluator.sentiment_analyser = _FixedSentimentAnalyser()
+    assert evaluator.get_tweet_sentiment({"user": {"screen_name": "ElonMusk"}}, "text") == -0.5
+    assert evaluator.get_tweet_sentiment({"user": {"name": "ElonMusk"}}, "text") == -0.5
+    assert evaluator.get_tweet_sentiment({"user": {"screen_name": "Someone"}}, "text") == START_PENDING_EVAL_NOTE
+    assert evaluator.get_tweet_sentiment({}, "text", is_a_quote=True) == -0.5
+
+
+def test_get_tweet_sentiment_with_missing_user():
+    evaluator = _get_evaluator([_get_crypto_currency("Bitcoin", ["ElonMusk"], [])])
+    evaluator.sentiment_analyser = _FixedSentimentAnalyser()
+    assert evaluator.get_tweet_sentiment({}, "text") == START_PENDING_EVAL_NOTE
+
+
+def test_get_tweet_sentiment_with_missing_symbol():
+    evaluator = _get_evaluator([_get_crypto_currency("Ethereum", ["ElonMusk"], [])])
+    evaluator.sentiment_analyser = _FixedSentimentAnalyser()
+    assert evaluator.get_tweet_sentiment({"user": {"screen_name": "ElonMusk"}}, "text") == START_PENDING_EVAL_NOTE